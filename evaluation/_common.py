@@ -0,0 +1,28 @@
+# Shared label encoding and agreement metrics for the RQ1 and RQ2 evaluation scripts.
+
+import numpy as np
+
+# pandas' default read_csv na_values; passed to polars so that cells such as "NA"
+# or "None" still read as missing (and end up in the "nan" class) as before.
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+def encode_labels(y_true: np.ndarray, y_pred: np.ndarray):
+    labels, codes = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    n = len(y_true)
+    return labels, codes[:n], codes[n:]
+
+def confusion_matrix(yt_codes: np.ndarray, yp_codes: np.ndarray, k: int) -> np.ndarray:
+    return np.bincount(yt_codes * k + yp_codes, minlength=k * k).reshape(k, k)
+
+def cohen_kappa(cm: np.ndarray) -> float:
+    n = cm.sum()
+    po = np.trace(cm) / n
+    pe = (cm.sum(axis=0) * cm.sum(axis=1)).sum() / n ** 2
+    return float((po - pe) / (1 - pe))
+
+def compute_kappa(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    labels, yt_codes, yp_codes = encode_labels(y_true, y_pred)
+    return cohen_kappa(confusion_matrix(yt_codes, yp_codes, len(labels)))
@@ -49,42 +49,55 @@ SOFTWARE.
 import argparse
 import json
 from pathlib import Path
-import pandas as pd
-from sklearn.metrics import (
-    cohen_kappa_score,
-    precision_score,
-    recall_score,
-    f1_score,
-    accuracy_score,
-    classification_report
-)
-
-def build_gold_standard(df: pd.DataFrame) -> pd.Series:
-    for col in ["coderA", "coderB", "adjudication"]:
-        if col in df.columns:
-            df[col] = df[col].astype(str).str.strip()
-
-    def decide(row):
-        adj = row.get("adjudication", "")
-        adj = "" if pd.isna(adj) else str(adj).strip()
-        if adj == "A":
-            return row["coderA"]
-        elif adj == "B":
-            return row["coderB"]
-        elif adj == "" or adj.lower() == "nan":
-            cons = row.get("consensus", None)
-            try:
-                cons = int(cons)
-            except Exception:
-                cons = None
-            if cons == 1:
-                return row["coderA"]
-            else:
-                return row["coderA"]
-        else:
-            return adj
-
-    return df.apply(decide, axis=1)
+import numpy as np
+import polars as pl
+from _common import PANDAS_NA_VALUES, encode_labels, confusion_matrix, cohen_kappa
+
+def build_gold_standard(df: pl.DataFrame) -> pl.Series:
+    adj = pl.col("adjudication").fill_null("").str.strip_chars()
+    gold = (
+        pl.when(adj == "A").then(pl.col("coderA"))
+        .when(adj == "B").then(pl.col("coderB"))
+        .when((adj == "") | (adj.str.to_lowercase() == "nan")).then(pl.col("coderA"))
+        .otherwise(adj)
+    )
+    return df.select(gold.alias("gold_standard")).to_series()
+
+def per_class_scores(cm: np.ndarray):
+    # zero_division=0 semantics: classes never predicted/observed score 0
+    tp = np.diag(cm)
+    predicted, support = cm.sum(axis=0), cm.sum(axis=1)
+    precision = np.divide(tp, predicted, out=np.zeros(len(tp)), where=predicted > 0)
+    recall = np.divide(tp, support, out=np.zeros(len(tp)), where=support > 0)
+    f1 = np.divide(2 * tp, predicted + support, out=np.zeros(len(tp)), where=(predicted + support) > 0)
+    return precision, recall, f1, support
+
+def average_scores(cm: np.ndarray, average: str):
+    if average == "micro":
+        acc = float(np.trace(cm) / cm.sum())
+        return acc, acc, acc
+    precision, recall, f1, support = per_class_scores(cm)
+    weights = support if average == "weighted" else None
+    return tuple(float(np.average(scores, weights=weights)) for scores in (precision, recall, f1))
+
+def build_classification_report(labels: np.ndarray, cm: np.ndarray) -> dict:
+    precision, recall, f1, support = per_class_scores(cm)
+    report = {
+        str(label): {"precision": p, "recall": r, "f1-score": f, "support": int(s)}
+        for label, p, r, f, s in zip(labels, precision, recall, f1, support)
+    }
+    report["accuracy"] = float(np.trace(cm) / cm.sum())
+    for name, average in [("macro avg", "macro"), ("weighted avg", "weighted")]:
+        p, r, f = average_scores(cm, average)
+        report[name] = {"precision": p, "recall": r, "f1-score": f, "support": int(cm.sum())}
+    return report
+
+def write_classification_report(report: dict, path: Path) -> None:
+    rows = ["precision", "recall", "f1-score", "support"]
+    columns = {"metric": rows}
+    for name, scores in report.items():
+        columns[name] = [float(scores[r]) for r in rows] if isinstance(scores, dict) else [float(scores)] * len(rows)
+    pl.DataFrame(columns).write_csv(path)
 
 def main():
     parser = argparse.ArgumentParser(description="RQ1 evaluation: RAG vs. Adjudicated Gold Standard")
@@ -101,22 +114,26 @@ def main():
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_csv(in_path, sep=None, engine="python")
-    df.columns = df.columns.str.replace("\ufeff", "", regex=False).str.strip()
+    with open(in_path, "rb") as f:
+        header = f.readline()
+    sep = ";" if header.count(b";") > header.count(b",") else ","
+    df = pl.read_csv(in_path, separator=sep, infer_schema=False, encoding="utf8", null_values=PANDAS_NA_VALUES)
+    df = df.rename({c: c.strip() for c in df.columns})
     required_cols = {"coderA", "coderB", "adjudication"}
     missing = required_cols - set(df.columns)
     if missing:
         raise ValueError(f"Missing required columns: {missing}. Found columns: {list(df.columns)}")
 
-    df["gold_standard"] = build_gold_standard(df)
-    y_true = df["gold_standard"].astype(str).str.strip()
-    y_pred = df["coderB"].astype(str).str.strip()
-
-    kappa = cohen_kappa_score(y_true, y_pred)
-    precision = precision_score(y_true, y_pred, average=args.average, zero_division=0)
-    recall = recall_score(y_true, y_pred, average=args.average, zero_division=0)
-    f1 = f1_score(y_true, y_pred, average=args.average, zero_division=0)
-    acc = accuracy_score(y_true, y_pred)
+    # Missing labels are kept as the literal "nan" class, as in the original pandas version.
+    df = df.with_columns([pl.col(c).fill_null("nan").str.strip_chars() for c in ["coderA", "coderB"]])
+    df = df.with_columns(build_gold_standard(df))
+    # Labels are stripped above and encoded once; the integer codes and the
+    # confusion matrix built from them feed every metric below.
+    labels, yt_codes, yp_codes = encode_labels(df["gold_standard"].to_numpy(), df["coderB"].to_numpy())
+    cm = confusion_matrix(yt_codes, yp_codes, len(labels))
+    kappa = cohen_kappa(cm)
+    precision, recall, f1 = average_scores(cm, args.average)
+    acc = float(np.trace(cm) / cm.sum())
 
     metrics = {
         "cohens_kappa": kappa,
@@ -127,8 +144,8 @@ def main():
     }
     (outdir / "metrics_rq1.json").write_text(json.dumps(metrics, indent=2), encoding="utf-8")
 
-    cls_report = classification_report(y_true, y_pred, zero_division=0, output_dict=True)
-    pd.DataFrame(cls_report).to_csv(outdir / "classification_report_rq1.csv", encoding="utf-8")
+    cls_report = build_classification_report(labels, cm)
+    write_classification_report(cls_report, outdir / "classification_report_rq1.csv")
 
     print("=== RQ1: RAG vs. Adjudicated Gold Standard ===")
     print(f"Cohen's kappa:         {kappa:.3f}")
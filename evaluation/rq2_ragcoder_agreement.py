@@ -35,20 +35,19 @@ SOFTWARE.
 ================================================================================
 """
 
-import pandas as pd
-from sklearn.metrics import cohen_kappa_score
+import polars as pl
+from _common import PANDAS_NA_VALUES, compute_kappa
 
 
 # The CSV must have columns: id;response_id;human_label;ragcoder_label;consensus
 file_path = "dataset_varinha_consenso.csv"
-df = pd.read_csv(file_path, sep=';')
+df = pl.read_csv(file_path, separator=';', schema_overrides={'human_label': pl.String, 'ragcoder_label': pl.String}, null_values=PANDAS_NA_VALUES)
 
 
-df['human_label'] = df['human_label'].astype(str).str.strip()
-df['ragcoder_label'] = df['ragcoder_label'].astype(str).str.strip()
+df = df.with_columns([pl.col(c).fill_null("nan").str.strip_chars() for c in ['human_label', 'ragcoder_label']])
 
 
-kappa = cohen_kappa_score(df['human_label'], df['ragcoder_label'])
+kappa = compute_kappa(df['human_label'].to_numpy(), df['ragcoder_label'].to_numpy())
 
 
 percent_consensus = df['consensus'].mean() * 100
@@ -74,12 +73,12 @@ print(f"% of responses not requiring adjudication: {percent_consensus:.2f}%")
 print(f"Interpretation: {level} agreement")
 
 
-output = pd.DataFrame({
+output = pl.DataFrame({
     "Metric": ["Cohen’s kappa", "Percent consensus", "Interpretation"],
     "Value": [f"{kappa:.3f}", f"{percent_consensus:.2f}%", level]
 })
 
 output_file = "ragcoder_rq2_results.csv"
-output.to_csv(output_file, index=False, encoding='utf-8-sig', sep=';')
+output.write_csv(output_file, separator=';', include_bom=True)
 
 print(f"\nResults saved to '{output_file}'")
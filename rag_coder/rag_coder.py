@@ -38,6 +38,7 @@ research validity and reproducibility.
 **Requirements:**
 - pandas
 - google-generativeai
+- orjson
 - tqdm
 
 ---
@@ -70,26 +71,51 @@ SOFTWARE.
 
 
 import os
+import csv
+import datetime
+import hashlib
 import pandas as pd
 import google.generativeai as genai
-import json
+import orjson
 import re
 import time
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from google.api_core import exceptions as api_exceptions
+from pathlib import Path
 from tqdm import tqdm
 
+_JSON_FENCE_RE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+
+# Bump when format_codebook/format_examples change so stale prompt caches are ignored.
+PROMPT_CACHE_VERSION = 1
+
+# Quota and transient server errors: the call is retried after a backoff instead of failing.
+RETRYABLE_API_ERRORS = (
+    api_exceptions.ResourceExhausted,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.DeadlineExceeded,
+    api_exceptions.InternalServerError,
+)
+
+# Guards the shared resume time that quota errors push back (see pause_calls).
+_RESUME_LOCK = threading.Lock()
+
+class ContentBlockedError(Exception):
+    """Raised when the model returns no usable text because the prompt or answer was blocked."""
+
 # --- Configuration Loader ---
 
 def load_config(filename="config.json"):
     """Loads the configuration from a JSON file."""
     try:
-        with open(filename, 'r') as f:
-            config = json.load(f)
-        return config
+        return orjson.loads(Path(filename).read_bytes())
     except FileNotFoundError:
         print(f"FATAL ERROR: Configuration file '{filename}' not found.")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"FATAL ERROR: Configuration file '{filename}' contains invalid JSON.")
         sys.exit(1)
 
@@ -108,146 +134,357 @@ def load_data(filepath, delimiter=';'):
     except FileNotFoundError:
         print(f"Error: The file {filepath} was not found."); return None
 
+def as_text(series):
+    """Converts a Series to strings, rendering missing values as 'nan' like str() does."""
+    return series.astype(object).fillna("nan").astype(str)
+
 def format_codebook(df):
     """Formats the codebook DataFrame into a readable string for the prompt."""
-    lines = []
-    for _, row in df.iterrows():
-        label = f"{row['category']}-{row['factor']}"
-        lines.append(f"- Label: `{label}`\n  Description: {row['description']}")
-    return "\n".join(lines)
+    labels = as_text(df['category']) + "-" + as_text(df['factor'])
+    return "\n".join("- Label: `" + labels + "`\n  Description: " + as_text(df['description']))
 
 def format_examples(df1, df2):
     """Formats the example studies into a readable string for the prompt."""
     examples_df = pd.concat([df1, df2], ignore_index=True)
-    lines = []
-    for _, row in examples_df.iterrows():
-        lines.append(f"Response: \"{row['response_text']}\"")
-        lines.append(f"Correct Label: `{row['label']}`")
-        lines.append("-" * 10)
-    return "\n".join(lines)
-
-def create_prompt(codebook_str, examples_str, new_response):
-    """Creates the full prompt with instructions, codebook, examples, and the new response."""
-    return f"""
-    You are a meticulous qualitative coding assistant for an academic study. Your job is to assign one or more labels from a given codebook to a user survey response.
+    return "\n".join(
+        "Response: \"" + as_text(examples_df['response_text']) + "\"\n"
+        + "Correct Label: `" + as_text(examples_df['label']) + "`\n"
+        + "-" * 10
+    )
 
-    Follow these constraints strictly:
-    1.  **Output Format**: You MUST output a valid JSON list `[...]`.
-    2.  **Allowed Labels**: You may ONLY choose labels from the "ALLOWED LABELS (CODEBOOK)" section. Do not invent new labels.
-    3.  **Evidence**: Use "span_evidence" to quote the shortest possible, direct span of text.
-    4.  **Multiple Codes**: If a response contains multiple distinct ideas, create a separate JSON object for each.
-    5.  **Ambiguity**: If the best label is not obvious, choose the closest match, set "ambiguous": true, and write a short note in "rationale".
-    6.  **No Code (NC)**: If no label applies reasonably, return an empty list `[]`.
-    7.  **Empty Answer (NA)**: If the response is empty or whitespace, return the string "NA".
+def build_codebook_str(codebook_file):
+    """Loads and formats the codebook, returning None if the file is missing."""
+    codebook_df = load_data(codebook_file)
+    return None if codebook_df is None else format_codebook(codebook_df)
 
-    --- ALLOWED LABELS (CODEBOOK) ---
-    {codebook_str}
+def build_examples_str(example_file_1, example_file_2):
+    """Loads and formats both example studies, returning None if either file is missing."""
+    study1_df, study2_df = load_data(example_file_1), load_data(example_file_2)
+    if study1_df is None or study2_df is None: return None
+    return format_examples(study1_df, study2_df)
 
-    --- EXAMPLES OF CORRECT CODING ---
-    {examples_str}
+def cached_prompt_section(cache_dir, name, paths, build):
+    """Returns a prompt section cached on disk under a hash of its input files, calling build(*paths) on a miss."""
+    digest = hashlib.blake2b(f"{name}:{PROMPT_CACHE_VERSION}".encode(), digest_size=16)
+    try:
+        for path in paths:
+            digest.update(Path(path).read_bytes())
+    except FileNotFoundError:
+        return build(*paths)
+
+    cache_file = Path(cache_dir) / f"{name}-{digest.hexdigest()}.prompt.txt"
+    if cache_file.exists():
+        return cache_file.read_text(encoding='utf-8')
+
+    section = build(*paths)
+    if section is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(section, encoding='utf-8')
+    return section
+
+SYSTEM_INSTRUCTION = """
+You are a meticulous qualitative coding assistant for an academic study. Your job is to assign one or more labels from a given codebook to a user survey response.
+
+Follow these constraints strictly:
+1.  **Output Format**: You MUST output a valid JSON list `[...]`.
+2.  **Allowed Labels**: You may ONLY choose labels from the "ALLOWED LABELS (CODEBOOK)" section. Do not invent new labels.
+3.  **Evidence**: Use "span_evidence" to quote the shortest possible, direct span of text.
+4.  **Multiple Codes**: If a response contains multiple distinct ideas, create a separate JSON object for each.
+5.  **Ambiguity**: If the best label is not obvious, choose the closest match, set "ambiguous": true, and write a short note in "rationale".
+6.  **No Code (NC)**: If no label applies reasonably, return an empty list `[]`.
+7.  **Empty Answer (NA)**: If the response is empty or whitespace, return the string "NA".
+"""
 
-    --- NEW RESPONSE TO CODE ---
-    Response: "{new_response}"
+def create_context(codebook_str, examples_str):
+    """Creates the static codebook and examples context shared by every request."""
+    return [
+        f"--- ALLOWED LABELS (CODEBOOK) ---\n{codebook_str}",
+        f"--- EXAMPLES OF CORRECT CODING ---\n{examples_str}",
+    ]
+
+def create_model(config, context):
+    """Creates the model with the static context cached server-side, falling back to a plain system instruction."""
+    model_name = config["api_settings"]["model_name"]
+    try:
+        cached_content = genai.caching.CachedContent.create(
+            model=model_name,
+            system_instruction=SYSTEM_INSTRUCTION,
+            contents=context,
+            ttl=datetime.timedelta(seconds=config["api_settings"].get("cache_ttl_seconds", 3600))
+        )
+        model = genai.GenerativeModel.from_cached_content(cached_content, generation_config=config["generation_config"])
+        return model, cached_content
+    except Exception as e:
+        print(f"Context caching unavailable ({e}); sending codebook and examples as a system instruction.")
+        model = genai.GenerativeModel(
+            model_name=model_name,
+            generation_config=config["generation_config"],
+            system_instruction="\n\n".join([SYSTEM_INSTRUCTION, *context])
+        )
+        return model, None
+
+def create_prompt(batch):
+    """Creates the per-request prompt for a numbered batch of (idx, response_text) pairs; instructions, codebook and examples live in the model context."""
+    # Each response is JSON-encoded so a multi-line answer stays on one numbered line.
+    responses = "\n".join(f'    {idx}. {orjson.dumps(response_text).decode()}' for idx, response_text in batch)
+    return f"""
+    --- NEW RESPONSES TO CODE ---
+{responses}
 
     --- YOUR JSON OUTPUT ---
-    IMPORTANT: Your entire response must be ONLY the JSON list...
+    IMPORTANT: Your entire response must be ONLY a JSON list with one object per numbered response, in order:
+    [{{"idx": <response number>, "codes": <the JSON output for that response>}}, ...]
     """
 
 def clean_json_output(raw_output):
     """Cleans the model's raw output to extract a valid JSON string."""
-    match = re.search(r'```json\s*([\s\S]*?)\s*```', raw_output)
-    if match: return match.group(1).strip()
-    return raw_output.strip()
+    match = _JSON_FENCE_RE.search(raw_output)
+    return match.group(1).strip() if match else raw_output.strip()
+
+def throttle(rate_slot, call_interval, resume_at):
+    """Blocks until the shared API slot is free and any quota pause has ended, then schedules the slot's release after 'call_interval' seconds."""
+    rate_slot.acquire()
+    # Re-checked after sleeping, since another worker's quota error may have pushed it back.
+    while (pause := resume_at[0] - time.monotonic()) > 0:
+        time.sleep(pause)
+    timer = threading.Timer(call_interval, rate_slot.release)
+    timer.daemon = True
+    timer.start()
+
+def pause_calls(resume_at, seconds):
+    """Delays the next API call of every worker until at least 'seconds' from now; overlapping pauses do not add up."""
+    with _RESUME_LOCK:
+        resume_at[0] = max(resume_at[0], time.monotonic() + seconds)
+
+def code_response(model, prompt, safety_settings, rate_slot, call_interval, resume_at, max_retries, retry_backoff_seconds):
+    """Sends a single prompt to the model and returns its cleaned raw output.
+
+    Quota and transient server errors are retried up to 'max_retries' times with an exponential
+    backoff. A quota error pauses every worker, since the quota is shared; any other transient
+    error only delays the retry of this call.
+    """
+    for attempt in range(max_retries + 1):
+        throttle(rate_slot, call_interval, resume_at)
+        try:
+            response = model.generate_content(prompt, safety_settings=safety_settings)
+            break
+        except RETRYABLE_API_ERRORS as e:
+            if attempt == max_retries: raise
+            backoff = retry_backoff_seconds * 2 ** attempt
+            if isinstance(e, api_exceptions.ResourceExhausted): pause_calls(resume_at, backoff)
+            else: time.sleep(backoff)
+        except (genai.types.BlockedPromptException, genai.types.StopCandidateException) as e:
+            raise ContentBlockedError(str(e)) from e
+    try:
+        text = response.text
+    except ValueError as e:
+        # response.text raises ValueError when every candidate was blocked or returned no parts.
+        raise ContentBlockedError(str(e)) from e
+    return clean_json_output(text)
+
+def parse_batch_output(cleaned_output, batch_size):
+    """Maps each batch index to its coded output, raising ValueError if the batch output is malformed."""
+    data = orjson.loads(cleaned_output)
+    if not isinstance(data, list):
+        raise ValueError("Batch output is not a JSON list")
+    # Only plain integer indices are accepted; anything else the model sends counts as malformed.
+    coded = {item['idx']: item['codes'] for item in data if isinstance(item, dict) and type(item.get('idx')) is int and 'codes' in item}
+    if set(coded) != set(range(1, batch_size + 1)):
+        raise ValueError("Batch output does not cover every response")
+    return coded
+
+def code_batch(send_prompt, batch):
+    """Codes a numbered batch of (idx, response_text) pairs with a single call to send_prompt.
+
+    If the output is malformed or blocked, each response of a larger batch is retried on its
+    own. Other API errors (quota, transport, server) fail the whole batch without splitting it,
+    since retrying every response separately would only multiply the traffic. Returns the
+    (idxs, prompt) pairs sent and, per idx, the coded output together with an error message
+    (None on success).
+    """
+    prompt = create_prompt(batch)
+    sent = [([idx for idx, _ in batch], prompt)]
+    try:
+        cleaned_output = send_prompt(prompt)
+    except ContentBlockedError as e:
+        failure = ([{"error": str(e)}], f"Content Blocked: {str(e)}")
+    except Exception as e:
+        return sent, {idx: ([{"error": str(e)}], f"API Exception: {str(e)}") for idx, _ in batch}
+    else:
+        try:
+            coded = parse_batch_output(cleaned_output, len(batch))
+            return sent, {idx: (coded[idx], None) for idx, _ in batch}
+        except (ValueError, TypeError):
+            failure = ([{"error": "JSON Decode Error"}], f"JSON Decode Error, Raw Output: {cleaned_output}")
+
+    if len(batch) == 1:
+        return sent, {batch[0][0]: failure}
+
+    results = {}
+    for idx, response_text in batch:
+        retry_sent, retry_results = code_batch(send_prompt, [(1, response_text)])
+        sent.extend(([idx], retry_prompt) for _, retry_prompt in retry_sent)
+        results[idx] = retry_results[1]
+    return sent, results
+
+def write_jsonl(file, record):
+    """Appends a record as a single JSON line and flushes it so progress survives interruptions."""
+    file.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY))
+    file.flush()
+
+def flatten_record(record):
+    """Flattens one coded response into one output row per assigned label."""
+    response_id, response_text, coded_output = record['response_id'], record['response_text'], record['coded_output']
+    if pd.isna(response_text) or response_text.lower() == 'nan': response_text = ''
+    if isinstance(coded_output, list) and coded_output:
+        labels = ["ERROR" if isinstance(item, dict) and 'error' in item else item.get('label', 'NC') if isinstance(item, dict) else 'MALFORMED' for item in coded_output]
+    elif isinstance(coded_output, list):
+        labels = ['NC']
+    else:
+        labels = ['NA' if coded_output == 'NA' else 'NC']
+    return [{'response_id': response_id, 'response_text': response_text, 'label': label} for label in labels]
+
+def write_ready_results(writer, raw_results, next_position, next_id):
+    """Writes buffered results that continue the input order and returns the updated position and row id."""
+    rows = []
+    while next_position in raw_results:
+        rows.extend(flatten_record(raw_results.pop(next_position)))
+        next_position += 1
+    writer.writerows({'id': row_id, **row} for row_id, row in enumerate(rows, start=next_id + 1))
+    return next_position, next_id + len(rows)
 
 
 def main():
     
     config = load_config()
-
-   
-    model = genai.GenerativeModel(
-        model_name=config["api_settings"]["model_name"],
-        generation_config=config["generation_config"]
-    )
     
     start_time = time.time()
     print("Loading data files...")
     
    
-    codebook_df = load_data(config["input_files"]["codebook_file"])
-    study1_df = load_data(config["input_files"]["example_file_1"])
-    study2_df = load_data(config["input_files"]["example_file_2"])
     new_responses_df = load_data(config["input_files"]["input_data_file"])
     
-    if any(df is None for df in [codebook_df, study1_df, study2_df, new_responses_df]): return
+    if new_responses_df is None: return
 
     print("Formatting codebook and examples...")
-    codebook_str = format_codebook(codebook_df)
-    examples_str = format_examples(study1_df, study2_df)
+    cache_dir = config["output_files"].get("prompt_cache_dir", "prompt_cache")
+    codebook_str = cached_prompt_section(cache_dir, "codebook", [config["input_files"]["codebook_file"]], build_codebook_str)
+    examples_str = cached_prompt_section(
+        cache_dir, "examples", [config["input_files"]["example_file_1"], config["input_files"]["example_file_2"]], build_examples_str
+    )
     
-    raw_results, audit_log, error_log, model_output_log = [], [], [], []
+    if codebook_str is None or examples_str is None: return
+    context = create_context(codebook_str, examples_str)
+    
+    raw_results, error_count = {}, 0
+
+    # Empty answers and configured placeholders ("n/a", "-", ...) are coded as NA without an API call.
+    response_texts = new_responses_df['response_text'].fillna('').astype(str).str.strip()
+    na_responses = {text.casefold() for text in config.get("prefilter", {}).get("na_responses", [])}
+    is_na = response_texts.eq('') | response_texts.str.casefold().isin(na_responses)
+    print(f"Skipping {int(is_na.sum())} empty or placeholder responses (coded as NA).")
 
-    print(f"Starting to code {len(new_responses_df)} new responses...")
-    for index, row in tqdm(new_responses_df.iterrows(), total=new_responses_df.shape[0]):
-        response_id, response_text = row['response_id'], str(row['response_text']).strip()
-        
-        response_text = response_text.replace('"', '\\"')
+    # Responses are keyed by their normalized text so duplicates share a single API call.
+    pending = {}
 
-        if not response_text:
-            raw_results.append({'response_id': response_id, 'response_text': '', 'coded_output': 'NA'})
+    responses = zip(new_responses_df['response_id'], response_texts, is_na)
+    for position, (response_id, text, skip) in enumerate(responses):
+        # The results keep the escaped text as before; the prompt gets the raw text, JSON-encoded.
+        response_text = text.replace('"', '\\"')
+
+        if skip:
+            raw_results[position] = {'response_id': response_id, 'response_text': response_text, 'coded_output': 'NA'}
             continue
-            
-        prompt = create_prompt(codebook_str, examples_str, response_text)
-        audit_log.append({'response_id': response_id, 'prompt_text': prompt})
 
-        try:
-            response = model.generate_content(prompt, safety_settings=config["safety_settings"])
-            
-            cleaned_output = clean_json_output(response.text)
-            try:
-                coded_data = json.loads(cleaned_output)
-            except json.JSONDecodeError:
-                error_log.append(f"ID: {response_id}, JSON Decode Error, Raw Output: {cleaned_output}")
-                coded_data = [{"error": "JSON Decode Error"}]
-            
-            model_output_log.append({'response_id': response_id, 'coded_output': coded_data})
-            raw_results.append({'response_id': response_id, 'response_text': response_text, 'coded_output': coded_data})
-
-        except Exception as e:
-            error_log.append(f"ID: {response_id}, API Exception: {str(e)}")
-            raw_results.append({'response_id': response_id, 'response_text': response_text, 'coded_output': [{"error": str(e)}]})
-        finally:
-            time.sleep(config["api_settings"]["seconds_to_wait"])
-
-    print("\nProcessing and flattening results...")
-    flattened_results = []
-    for record in raw_results:
-        response_id, response_text, coded_output = record['response_id'], record['response_text'], record['coded_output']
-        if pd.isna(response_text) or response_text.lower() == 'nan': response_text = ''
-        if isinstance(coded_output, list) and coded_output:
-            for item in coded_output:
-                label = "ERROR" if isinstance(item, dict) and 'error' in item else item.get('label', 'NC') if isinstance(item, dict) else 'MALFORMED'
-                flattened_results.append({'response_id': response_id, 'response_text': response_text, 'label': label})
-        elif isinstance(coded_output, list):
-             flattened_results.append({'response_id': response_id, 'response_text': response_text, 'label': 'NC'})
-        else:
-            label = 'NA' if coded_output == 'NA' else 'NC'
-            flattened_results.append({'response_id': response_id, 'response_text': response_text, 'label': label})
+        pending.setdefault(text.casefold(), (text, []))[1].append((position, response_id, response_text))
+
+    # A single slot released on a timer spaces the start of API calls by 'call_interval'
+    # across all workers, so the pool overlaps latency without exceeding the rate limit.
+    # With concurrent workers this is the only rate bound: 'seconds_to_wait' is no longer a
+    # pause after each completed call, so 'requests_per_minute' caps the overall rate.
+    rate_slot = threading.Semaphore(1)
+    # Monotonic time before which no call may start; quota errors push it back for every worker.
+    resume_at = [0.0]
+    api_settings = config["api_settings"]
+    call_interval = max(api_settings["seconds_to_wait"], 60 / api_settings.get("requests_per_minute", 60))
+    safety_settings = config["safety_settings"]
+    max_workers = api_settings.get("max_workers", 8)
+    batch_size = api_settings.get("batch_size", 8)
+
+    coded_count = sum(len(rows) for _, rows in pending.values())
+    if coded_count:
+        reused = coded_count - len(pending)
+        print(f"Reusing model output for {reused} duplicate responses ({reused / coded_count:.1%} cache hit rate).")
+
+    # Each batch packs up to 'batch_size' unique responses into one prompt.
+    units = list(pending.values())
+    batches = [units[start:start + batch_size] for start in range(0, len(units), batch_size)]
+
+    model, cached_content = create_model(config, context)
+    send_prompt = partial(
+        code_response, model,
+        safety_settings=safety_settings,
+        rate_slot=rate_slot,
+        call_interval=call_interval,
+        resume_at=resume_at,
+        max_retries=api_settings.get("max_retries", 3),
+        retry_backoff_seconds=api_settings.get("retry_backoff_seconds", 10)
+    )
 
+    print(f"Starting to code {len(new_responses_df)} new responses in {len(batches)} batches...")
+    try:
+        # Results are buffered by input position only until every earlier row is written,
+        # so the CSV keeps the input order while calls complete out of order.
+        with open(config["output_files"]["results_file"], 'w', newline='', encoding='utf-8-sig') as results_file, \
+                open(config["output_files"]["audit_file"], 'wb') as audit_file, \
+                open(config["output_files"]["model_log_file"], 'wb') as model_log_file, \
+                open(config["output_files"]["error_file"], 'w', encoding='utf-8') as error_file, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            write_jsonl(audit_file, {'response_ids': [], 'prompt_text': "\n\n".join([SYSTEM_INSTRUCTION, *context])})
+            writer = csv.DictWriter(results_file, fieldnames=['id', 'response_id', 'response_text', 'label'], delimiter=';', lineterminator=os.linesep)
+            writer.writeheader()
+            next_position, next_id = write_ready_results(writer, raw_results, 0, 0)
+
+            futures = {
+                executor.submit(
+                    code_batch, send_prompt, [(idx, response_text) for idx, (response_text, _) in enumerate(batch, start=1)]
+                ): batch
+                for batch in batches
+            }
+            # Leaving the 'with' would otherwise wait for every queued batch, so an error or
+            # Ctrl-C here cancels the batches not yet started instead of paying for them.
+            try:
+                for future in tqdm(as_completed(futures), total=len(futures), mininterval=1.0, miniters=max(1, len(futures) // 100)):
+                    batch = futures[future]
+                    sent, results = future.result()
+                    for idxs, prompt in sent:
+                        write_jsonl(audit_file, {'response_ids': [rid for idx in idxs for _, rid, _ in batch[idx - 1][1]], 'prompt_text': prompt})
+
+                    for idx, (_, rows) in enumerate(batch, start=1):
+                        coded_data, error = results[idx]
+                        for position, response_id, response_text in rows:
+                            if error:
+                                error_file.write(f"ID: {response_id}, {error}\n")
+                                error_file.flush()
+                                error_count += 1
+                            write_jsonl(model_log_file, {'response_id': response_id, 'coded_output': coded_data})
+                            raw_results[position] = {'response_id': response_id, 'response_text': response_text, 'coded_output': coded_data}
+
+                    next_position, next_id = write_ready_results(writer, raw_results, next_position, next_id)
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        # The server-side cache is billed until its TTL expires, so drop it even if coding failed.
+        if cached_content is not None:
+            try: cached_content.delete()
+            except Exception as e: print(f"Warning: could not delete cached context: {e}")
     
-    output_df = pd.DataFrame(flattened_results)
-    output_df.insert(0, 'id', range(1, 1 + len(output_df)))
-    output_df[['id', 'response_id', 'response_text', 'label']].to_csv(config["output_files"]["results_file"], index=False, sep=';', encoding='utf-8-sig')
-    
-    with open(config["output_files"]["audit_file"], 'w', encoding='utf-8') as f: json.dump(audit_log, f, indent=4, ensure_ascii=False)
-    with open(config["output_files"]["model_log_file"], 'w', encoding='utf-8') as f: json.dump(model_output_log, f, indent=4, ensure_ascii=False)
-    with open(config["output_files"]["error_file"], 'w', encoding='utf-8') as f: f.write("\n".join(error_log))
-
     print(f"\n--- Script Finished ---")
     print(f"✅ Results saved to: {config['output_files']['results_file']}")
     print(f"✅ Audit trail saved to: {config['output_files']['audit_file']}")
     print(f"✅ Model outputs saved to: {config['output_files']['model_log_file']}")
-    if error_log: print(f"⚠️ Errors were logged. Please check: {config['output_files']['error_file']}")
+    if error_count: print(f"⚠️ Errors were logged. Please check: {config['output_files']['error_file']}")
     else: print("✅ No errors were logged.")
     
     duration = time.time() - start_time